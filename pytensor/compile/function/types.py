@@ -55,7 +55,7 @@ def alias_root(v):
         return v
     vmap = v.owner.op.view_map
     dmap = v.owner.op.destroy_map
-    outpos = v.owner.outputs.index(v)
+    outpos = v.index
     v_views = vmap.get(outpos, []) + dmap.get(outpos, [])
     if len(v_views) > 1:
         raise NotImplementedError(
@@ -261,17 +261,13 @@ def Rop(
                     # arguments, like for example random states
                     local_eval_points.append(None)
             elif inp.owner in seen_nodes:
-                local_eval_points.append(
-                    seen_nodes[inp.owner][inp.owner.outputs.index(inp)]
-                )
+                local_eval_points.append(seen_nodes[inp.owner][inp.index])
 
             else:
                 # We actually need to compute the R_op for this node
 
                 _traverse(inp.owner)
-                local_eval_points.append(
-                    seen_nodes[inp.owner][inp.owner.outputs.index(inp)]
-                )
+                local_eval_points.append(seen_nodes[inp.owner][inp.index])
         same_type_eval_points = []
         for x, y in zip(inputs, local_eval_points):
             if y is not None:
@@ -313,10 +309,15 @@ def Rop(
     for out in _f:
         if out in _wrt:
             rval.append(_eval_points[_wrt.index(out)])
-        elif (
-            seen_nodes.get(out.owner, None) is None
-            or seen_nodes[out.owner][out.owner.outputs.index(out)] is None
-        ):
+            continue
+
+        out_eval_point: Optional[Variable] = None
+        if seen_nodes.get(out.owner, None) is not None:
+            idx = out.index
+            assert idx is not None
+            out_eval_point = seen_nodes[out.owner][idx]
+
+        if out_eval_point is None:
             message = (
                 "Rop method was asked to compute the gradient "
                 "with respect to a variable that is not part of "
@@ -349,7 +350,7 @@ def Rop(
                     "'zero', 'None' and 'Disconnected'."
                 )
         else:
-            rval.append(seen_nodes[out.owner][out.owner.outputs.index(out)])
+            rval.append(out_eval_point)
 
     using_list = isinstance(f, list)
     using_tuple = isinstance(f, tuple)
@@ -932,7 +933,7 @@ def _populate_var_to_app_to_idx(outputs, wrt, consider_constant):
 
             connection_pattern = _node_to_pattern(app)
 
-            var_idx = app.outputs.index(var)
+            var_idx = var.index
 
             for i, ipt in enumerate(app.inputs):
                 # don't process ipt if it is not a true
@@ -411,23 +411,11 @@ class Variable(Node, Generic[_TypeType, OptionalApplyType]):
     # __slots__ = ['type', 'owner', 'index', 'name']
     __count__ = count(0)
 
-    _owner: OptionalApplyType
-
-    @property
-    def owner(self) -> OptionalApplyType:
-        return self._owner
-
-    @owner.setter
-    def owner(self, value) -> None:
-        self._owner = value
-
-    @property
-    def index(self):
-        return self._index
-
-    @index.setter
-    def index(self, value):
-        self._index = value
+    # `owner` and `index` are read on every graph traversal, so they are
+    # plain instance attributes here; subclasses that need to validate
+    # them (e.g. `AtomicVariable`) override them with properties.
+    owner: OptionalApplyType
+    index: Optional[int]
 
     def __init__(
         self,
@@ -442,7 +430,7 @@ class Variable(Node, Generic[_TypeType, OptionalApplyType]):
 
         self.type = type
 
-        self._owner = owner
+        self.owner = owner
 
         if owner is not None and not isinstance(owner, Apply):
             raise TypeError("owner must be an Apply instance")
@@ -637,6 +625,19 @@ class Variable(Node, Generic[_TypeType, OptionalApplyType]):
             d["tag"] = t
         return d
 
+    def __setstate__(self, d):
+        if "_owner" in d or "_index" in d:
+            # Pickles from when `owner` and `index` were stored behind
+            # properties.  Subclasses that still define them as properties
+            # (e.g. `AtomicVariable`) don't keep them in `__dict__`.
+            d = dict(d)
+            for old_key, key in (("_owner", "owner"), ("_index", "index")):
+                if old_key in d:
+                    value = d.pop(old_key)
+                    if not isinstance(getattr(type(self), key, None), property):
+                        d[key] = value
+        self.__dict__.update(d)
+
 
 class AtomicVariable(Variable[_TypeType, None]):
     """A node type that has no ancestors and should never be considered an input to a graph."""
@@ -1638,7 +1639,7 @@ def as_string(
     def describe(r):
         if r.owner is not None and r not in i and r not in orph:
             op = r.owner
-            idx = op.outputs.index(r)
+            idx = r.index
             if len(op.outputs) == 1:
                 idxs = ""
             else:
@@ -1820,7 +1821,7 @@ def equal_computations(
         if y.owner and not x.owner:
             return False
         if x.owner and y.owner:
-            if x.owner.outputs.index(x) != y.owner.outputs.index(y):
+            if x.index != y.index:
                 return False
         if x not in in_xs and not (y.type.in_same_class(x.type)):
             return False
@@ -1884,11 +1885,7 @@ def equal_computations(
                 if (dx, dy) not in common:
                     # Equality between the variables is unknown, compare
                     # their respective owners, if they have some
-                    if (
-                        dx.owner
-                        and dy.owner
-                        and dx.owner.outputs.index(dx) == dy.owner.outputs.index(dy)
-                    ):
+                    if dx.owner and dy.owner and dx.index == dy.index:
                         nodes_equal = compare_nodes(
                             dx.owner, dy.owner, common, different
                         )
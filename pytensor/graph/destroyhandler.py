@@ -475,7 +475,7 @@ class DestroyHandler(Bookkeeper):  # noqa
                 )
             elif inp.owner:
                 app2 = inp.owner
-                inp_idx2 = app2.outputs.index(inp)
+                inp_idx2 = inp.index
                 v = app2.op.view_map
                 d = app2.op.destroy_map
                 if v:
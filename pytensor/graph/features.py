@@ -790,7 +790,7 @@ class NoOutputFromInplace(Feature):
             # Validate that the node that produces the output does not produce
             # it by modifying something else in-place.
             op = node.op
-            out_idx = node.outputs.index(out)
+            out_idx = out.index
             if out_idx in op.destroy_map:
                 raise InconsistencyError(
                     "A function graph Feature has requested that outputs of the graph "
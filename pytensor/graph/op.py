@@ -310,9 +310,6 @@ class Op(MetaObject):
             else:
                 return node.outputs
 
-    def __ne__(self, other: Any) -> bool:
-        return not (self == other)
-
     # Convenience so that subclass implementers don't have to import utils
     # just to self.add_tag_trace
     add_tag_trace = staticmethod(add_tag_trace)
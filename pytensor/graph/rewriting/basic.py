@@ -2877,7 +2877,7 @@ def pre_greedy_node_rewriter(
                     )
                     for k, v in zip(inp.owner.outputs, outs):
                         rewritten_vars[k] = v
-                    nw_in = outs[inp.owner.outputs.index(inp)]
+                    nw_in = outs[inp.index]
 
                 else:
                     nw_in = inp
@@ -2904,7 +2904,8 @@ def pre_greedy_node_rewriter(
         return results, rewritten_vars
 
     if out.owner:
-        out_index: int = out.owner.outputs.index(out)
+        assert out.index is not None
+        out_index = out.index
     else:
         out_index = 0
 
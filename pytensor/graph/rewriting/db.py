@@ -436,7 +436,7 @@ class SequenceDB(RewriteDatabase):
                     # class name for descriptiveness and id to avoid name
                     # collisions)
                     rewrite, position = extra_rewrite
-                    rewrite.name = f"{rewrite.__class__}_{id(rewrite)}"
+                    rewrite.name = f"{type(rewrite).__name__}_{id(rewrite)}"
 
                     if position < position_cutoff:
                         rewrites.add(rewrite)
@@ -256,9 +256,6 @@ class MetaType(ABCMeta):
 class MetaObject(metaclass=MetaType):
     __slots__: List = []
 
-    def __ne__(self, other):
-        return not self == other
-
 
 class Scratchpad:
     def clear(self):
@@ -517,7 +517,7 @@ def ifelse_lift_single_if_through_acceptable_ops(fgraph, main_node):
 
     for x in main_node.inputs:
         if x in node.outputs:
-            idx = node.outputs.index(x)
+            idx = x.index
             true_ins.append(aes[idx])
             false_ins.append(fs[idx])
         else:
@@ -548,7 +548,7 @@ def cond_merge_ifs_true(fgraph, node):
         ):
             ins_op = tval.owner.op
             ins_t = tval.owner.inputs[1:][: ins_op.n_outs]
-            replace[idx + 1] = ins_t[tval.owner.outputs.index(tval)]
+            replace[idx + 1] = ins_t[tval.index]
 
     if len(replace) == 0:
         return False
@@ -575,7 +575,7 @@ def cond_merge_ifs_false(fgraph, node):
         ):
             ins_op = fval.owner.op
             ins_t = fval.owner.inputs[1:][ins_op.n_outs :]
-            replace[idx + 1 + op.n_outs] = ins_t[fval.owner.outputs.index(fval)]
+            replace[idx + 1 + op.n_outs] = ins_t[fval.index]
 
     if len(replace) == 0:
         return False
@@ -106,13 +106,18 @@ class Container:
             if self.allow_downcast is not None:
                 kwargs["allow_downcast"] = self.allow_downcast
 
-            try:
-                # Use in-place filtering when/if possible
-                self.storage[0] = self.type.filter_inplace(
-                    value, self.storage[0], **kwargs
-                )
-            except NotImplementedError:
-                self.storage[0] = self.type.filter(value, **kwargs)
+            # Use in-place filtering when/if possible.  Most types don't
+            # implement it, so skip the raise/catch round-trip for them.
+            if type(self.type).filter_inplace is not Type.filter_inplace:
+                try:
+                    self.storage[0] = self.type.filter_inplace(
+                        value, self.storage[0], **kwargs
+                    )
+                    return
+                except NotImplementedError:
+                    pass
+
+            self.storage[0] = self.type.filter(value, **kwargs)
 
         except Exception as e:
             e.args = e.args + (f'Container name "{self.name}"',)
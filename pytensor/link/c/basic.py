@@ -1446,11 +1446,11 @@ class CLinker(Linker):
                 if i in fgraph.outputs:
                     isig = (
                         op_pos[i.owner],  # outputs
-                        i.owner.outputs.index(i),
+                        i.index,
                         fgraph.outputs.index(i),
                     )
                 else:
-                    isig = (op_pos[i.owner], i.owner.outputs.index(i))  # temps
+                    isig = (op_pos[i.owner], i.index)  # temps
             return (isig, i in no_recycling)
 
         version = []
@@ -98,15 +98,12 @@ class Generic(CType, Singleton):
         """
 
     def c_sync(self, name, sub):
-        return (
-            """
-        assert(py_%(name)s->ob_refcnt > 1);
-        Py_DECREF(py_%(name)s);
-        py_%(name)s = %(name)s ? %(name)s : Py_None;
-        Py_INCREF(py_%(name)s);
+        return f"""
+        assert(py_{name}->ob_refcnt > 1);
+        Py_DECREF(py_{name});
+        py_{name} = {name} ? {name} : Py_None;
+        Py_INCREF(py_{name});
         """
-            % locals()
-        )
 
     def c_code_cache_version(self):
         return (1,)
@@ -529,6 +526,10 @@ class EnumType(CType, dict):
             and all(self.aliases[a] == other.aliases[a] for a in self.aliases)
         )
 
+    def __ne__(self, other):
+        # Don't fall back to `dict.__ne__`, which ignores `ctype` and `aliases`
+        return not self == other
+
     # EnumType should be used to create constants available in both Python and C code.
     # However, for convenience, we make sure EnumType can have a value, like other common types,
     # such that it could be used as-is as an op param.
@@ -452,7 +452,7 @@ def raise_with_op(
                         # If it is a view, don't count it twice.
                         vmap = k.owner.op.view_map
                         if vmap:
-                            out_idx = k.owner.outputs.index(k)
+                            out_idx = k.index
                             data = storage_map[k][0]
                             if out_idx in vmap:
                                 assert len(vmap[out_idx]) == 1
@@ -467,7 +467,7 @@ def raise_with_op(
                         # we still must check it.
                         dmap = k.owner.op.destroy_map
                         if dmap:
-                            out_idx = k.owner.outputs.index(k)
+                            out_idx = k.index
                             data = storage_map[k][0]
                             if out_idx in dmap:
                                 assert len(dmap[out_idx]) == 1
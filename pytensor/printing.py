@@ -615,7 +615,7 @@ def _debugprint(
         if len(node.outputs) == 1:
             output_idx = ""
         else:
-            output_idx = f".{node.outputs.index(var)}"
+            output_idx = f".{var.index}"
 
         if id_str:
             id_str = f" {id_str}"
@@ -912,7 +912,7 @@ class PatternPrinter(Printer):
                 f"Patterns {self.patterns} cannot represent a variable that is "
                 "not the result of an operation"
             )
-        idx = node.outputs.index(output)
+        idx = output.index
         pattern, precedences = self.patterns[idx]
         precedences += (1000,) * len(node.inputs)
 
@@ -960,7 +960,7 @@ class FunctionPrinter(Printer):
                 f"function {self.names} cannot represent a variable that is "
                 "not the result of an operation"
             )
-        idx = node.outputs.index(output)
+        idx = output.index
         name = self.names[idx]
         with set_precedence(pstate):
             inputs_str = ", ".join(
@@ -14,6 +14,7 @@ import builtins
 import math
 from collections.abc import Callable
 from copy import copy
+from functools import lru_cache
 from itertools import chain
 from textwrap import dedent
 from typing import Any, Dict, Mapping, Optional, Tuple, Type, Union
@@ -502,23 +503,32 @@ class ScalarType(CType, HasDataType, HasShape):
 
     def c_support_code(self, **kwargs):
         if self.dtype.startswith("complex"):
-            cplx_types = ["pytensor_complex64", "pytensor_complex128"]
-            real_types = [
-                "npy_int8",
-                "npy_int16",
-                "npy_int32",
-                "npy_int64",
-                "npy_float32",
-                "npy_float64",
-            ]
-            # If the 'int' C type is not exactly the same as an existing
-            # 'npy_intX', some C code may not compile, e.g. when assigning
-            # the value 0 (cast to 'int' in C) to an PyTensor_complex64.
-            if np.dtype("intc").num not in [np.dtype(d[4:]).num for d in real_types]:
-                # In that case we add the 'int' type to the real types.
-                real_types.append("int")
-
-            template = """
+            return self._complex_support_code()
+        else:
+            return ""
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _complex_support_code():
+        # This code is the same for every complex `ScalarType` and only
+        # depends on the platform, so it is generated once per process.
+        cplx_types = ["pytensor_complex64", "pytensor_complex128"]
+        real_types = [
+            "npy_int8",
+            "npy_int16",
+            "npy_int32",
+            "npy_int64",
+            "npy_float32",
+            "npy_float64",
+        ]
+        # If the 'int' C type is not exactly the same as an existing
+        # 'npy_intX', some C code may not compile, e.g. when assigning
+        # the value 0 (cast to 'int' in C) to an PyTensor_complex64.
+        if np.dtype("intc").num not in [np.dtype(d[4:]).num for d in real_types]:
+            # In that case we add the 'int' type to the real types.
+            real_types.append("int")
+
+        template = """
             struct pytensor_complex%(nbits)s : public npy_complex%(nbits)s
             {
                 typedef pytensor_complex%(nbits)s complex_type;
@@ -575,36 +585,36 @@ class ScalarType(CType, HasDataType, HasShape):
             };
             """
 
-            def operator_eq_real(mytype, othertype):
-                return f"""
+        def operator_eq_real(mytype, othertype):
+            return f"""
                 template <> {mytype} & {mytype}::operator=<{othertype}>(const {othertype} & y)
                 {{ this->real=y; this->imag=0; return *this; }}
                 """
 
-            def operator_eq_cplx(mytype, othertype):
-                return f"""
+        def operator_eq_cplx(mytype, othertype):
+            return f"""
                 template <> {mytype} & {mytype}::operator=<{othertype}>(const {othertype} & y)
                 {{ this->real=y.real; this->imag=y.imag; return *this; }}
                 """
 
-            operator_eq = "".join(
-                operator_eq_real(ctype, rtype)
-                for ctype in cplx_types
-                for rtype in real_types
-            ) + "".join(
-                operator_eq_cplx(ctype1, ctype2)
-                for ctype1 in cplx_types
-                for ctype2 in cplx_types
-            )
+        operator_eq = "".join(
+            operator_eq_real(ctype, rtype)
+            for ctype in cplx_types
+            for rtype in real_types
+        ) + "".join(
+            operator_eq_cplx(ctype1, ctype2)
+            for ctype1 in cplx_types
+            for ctype2 in cplx_types
+        )
 
-            # We are not using C++ generic templating here, because this would
-            # generate two different functions for adding a complex64 and a
-            # complex128, one returning a complex64, the other a complex128,
-            # and the compiler complains it is ambiguous.
-            # Instead, we generate code for known and safe types only.
+        # We are not using C++ generic templating here, because this would
+        # generate two different functions for adding a complex64 and a
+        # complex128, one returning a complex64, the other a complex128,
+        # and the compiler complains it is ambiguous.
+        # Instead, we generate code for known and safe types only.
 
-            def operator_plus_real(mytype, othertype):
-                return f"""
+        def operator_plus_real(mytype, othertype):
+            return f"""
                 const {mytype} operator+(const {mytype} &x, const {othertype} &y)
                 {{ return {mytype}(x.real+y, x.imag); }}
 
@@ -612,14 +622,14 @@ class ScalarType(CType, HasDataType, HasShape):
                 {{ return {mytype}(x.real+y, x.imag); }}
                 """
 
-            operator_plus = "".join(
-                operator_plus_real(ctype, rtype)
-                for ctype in cplx_types
-                for rtype in real_types
-            )
+        operator_plus = "".join(
+            operator_plus_real(ctype, rtype)
+            for ctype in cplx_types
+            for rtype in real_types
+        )
 
-            def operator_minus_real(mytype, othertype):
-                return f"""
+        def operator_minus_real(mytype, othertype):
+            return f"""
                 const {mytype} operator-(const {mytype} &x, const {othertype} &y)
                 {{ return {mytype}(x.real-y, x.imag); }}
 
@@ -627,14 +637,14 @@ class ScalarType(CType, HasDataType, HasShape):
                 {{ return {mytype}(y-x.real, -x.imag); }}
                 """
 
-            operator_minus = "".join(
-                operator_minus_real(ctype, rtype)
-                for ctype in cplx_types
-                for rtype in real_types
-            )
+        operator_minus = "".join(
+            operator_minus_real(ctype, rtype)
+            for ctype in cplx_types
+            for rtype in real_types
+        )
 
-            def operator_mul_real(mytype, othertype):
-                return f"""
+        def operator_mul_real(mytype, othertype):
+            return f"""
                 const {mytype} operator*(const {mytype} &x, const {othertype} &y)
                 {{ return {mytype}(x.real*y, x.imag*y); }}
 
@@ -642,23 +652,20 @@ class ScalarType(CType, HasDataType, HasShape):
                 {{ return {mytype}(x.real*y, x.imag*y); }}
                 """
 
-            operator_mul = "".join(
-                operator_mul_real(ctype, rtype)
-                for ctype in cplx_types
-                for rtype in real_types
-            )
-
-            return (
-                template % dict(nbits=64, half_nbits=32)
-                + template % dict(nbits=128, half_nbits=64)
-                + operator_eq
-                + operator_plus
-                + operator_minus
-                + operator_mul
-            )
+        operator_mul = "".join(
+            operator_mul_real(ctype, rtype)
+            for ctype in cplx_types
+            for rtype in real_types
+        )
 
-        else:
-            return ""
+        return (
+            template % dict(nbits=64, half_nbits=32)
+            + template % dict(nbits=128, half_nbits=64)
+            + operator_eq
+            + operator_plus
+            + operator_minus
+            + operator_mul
+        )
 
     def c_init_code(self, **kwargs):
         return ["import_array();"]
@@ -4233,7 +4240,7 @@ class Composite(ScalarInnerGraphOp):
                     new_outputs.append(output)
                 else:
                     node = output.owner
-                    output_idx = node.outputs.index(output)
+                    output_idx = output.index
                     new_output = node.clone().outputs[output_idx]
                     new_outputs.append(new_output)
             fgraph = FunctionGraph(fgraph.inputs, new_outputs, clone=False)
@@ -133,7 +133,7 @@ class ScalarLoop(ScalarInnerGraphOp):
                     new_outputs.append(output)
                 else:
                     node = output.owner
-                    output_idx = node.outputs.index(output)
+                    output_idx = output.index
                     new_output = node.clone().outputs[output_idx]
                     new_outputs.append(new_output)
             fgraph = FunctionGraph(fgraph.inputs, new_outputs, clone=False)
@@ -638,7 +638,7 @@ class Elemwise(OpenMPOp):
             new_r = Elemwise(node.op, {})(*[transform(ipt) for ipt in node.inputs])
             if isinstance(new_r, (list, tuple)):
                 # Scalar Op with multiple outputs
-                new_r = new_r[r.owner.outputs.index(r)]
+                new_r = new_r[r.index]
             return new_r
 
         ret = []
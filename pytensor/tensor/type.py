@@ -550,18 +550,13 @@ class TensorType(CType[np.ndarray], HasDataType, HasShape):
         )
 
     def c_cleanup(self, name, sub):
-        return (
-            """
-        if (%(name)s) {
-            Py_XDECREF(%(name)s);
-        }
+        return f"""
+        if ({name}) {{
+            Py_XDECREF({name});
+        }}
         """
-            % locals()
-        )
 
     def c_sync(self, name, sub):
-        fail = sub["fail"]
-        type_num = self.dtype_specs()[2]
         return (
             """
         {Py_XDECREF(py_%(name)s);}
@@ -599,7 +594,7 @@ class TensorType(CType[np.ndarray], HasDataType, HasShape):
             %(fail)s
         }
         """
-            % locals()
+            % dict(name=name, fail=sub["fail"])
         )
 
     def c_headers(self, **kwargs):
@@ -703,6 +703,33 @@ def test_variable_depends_on():
     assert variable_depends_on(y, [y])
 
 
+def test_variable_setstate_legacy_owner():
+    x = MyVariable(1)
+    y = MyOp(x)
+
+    # Older pickles stored `owner` and `index` as `_owner` and `_index`
+    state = y.__getstate__()
+    state["_owner"] = state.pop("owner")
+    state["_index"] = state.pop("index")
+
+    y_new = Variable.__new__(Variable)
+    y_new.__setstate__(state)
+    assert y_new.owner is y.owner
+    assert y_new.index == 0
+    assert "_owner" not in y_new.__dict__
+
+    # Atomic variables only stored `_owner`, and their `owner`/`index`
+    # properties must not end up shadowed in `__dict__`
+    state = NoneConst.__getstate__()
+    state["_owner"] = None
+
+    c_new = type(NoneConst).__new__(type(NoneConst))
+    c_new.__setstate__(state)
+    assert c_new.owner is None
+    assert c_new.index is None
+    assert not {"_owner", "_index", "owner", "index"} & set(c_new.__dict__)
+
+
 class TestTruncatedGraphInputs:
     def test_basic(self):
         """
@@ -234,3 +234,30 @@ def test_container_deepcopy():
         assert isinstance(d.storage[0], np.ndarray), (d.storage[0], type(d.storage[0]))
         assert d.storage[0].dtype == v.dtype, (d.storage[0].dtype, v.dtype)
         assert d.storage[0].dtype == c.type.dtype, (d.storage[0].dtype, c.type.dtype)
+
+
+def test_container_filter_inplace():
+    class InplaceType(Type):
+        def filter(self, data, strict=False, allow_downcast=None):
+            return ("filter", data)
+
+        def filter_inplace(self, value, storage, strict=False, allow_downcast=None):
+            return ("filter_inplace", value)
+
+    class NoInplaceType(InplaceType):
+        def filter_inplace(self, value, storage, strict=False, allow_downcast=None):
+            raise NotImplementedError()
+
+    c = Container(InplaceType(), [None])
+    c.data = 1
+    assert c.storage[0] == ("filter_inplace", 1)
+
+    c = Container(NoInplaceType(), [None])
+    c.data = 1
+    assert c.storage[0] == ("filter", 1)
+
+    t = scalar().type
+    assert type(t).filter_inplace is Type.filter_inplace
+    c = Container(t, [None])
+    c.data = 1.0
+    assert c.storage[0] == 1.0